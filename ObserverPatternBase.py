@@ -15,61 +15,236 @@ Exported Functions:
 """
 
 
-class Observer:
+# Standard imports
+import functools
+import types
+import weakref
+from abc import ABC, abstractmethod
+
+
+class Observer(ABC):
     """
     Base class for all objects that will be an Object in an Observer design pattern.
 
-    Child classes must implement the update(...) method.
+    Child classes must implement the update(...) method, otherwise they cannot be instantiated.
+
+    Child classes may set async_safe = True if their update(...) (or attach(...) handler) may be run on a worker
+    thread by Subject.notify_async(...). Such an update must not touch tkinter widgets directly.
+
+    Subjects hold their observers by weak reference, so a child class that defines __slots__ must include '__weakref__'
+    in them (unless another base class, e.g., Subject, already provides it), otherwise it cannot be attached.
     """
+    __slots__ = ()
+
+    async_safe = False
+
     def __init__(self):
         pass
 
+    @abstractmethod
     def update(self, subject):
         """
         Interface method called by Subject to notify observer of a change in state. Must be implemented by children.
-        Will raise NotImplementedError if called.
         :parameter subject: Which Subject instance is notifying the Observer instance?
         :return None:
         """
-        raise NotImplementedError
-        return None
+
+
+def _drop_dead_handler(handlers, ref):
+    """
+    Weak reference callback, called when an attached observer is garbage collected, that removes the observer's entry
+    from a Subject's handlers, so that its handler is not kept alive.
+    :parameter handlers: The _handlers dictionary of the Subject
+    :parameter ref: The weakref.KeyedRef to the observer, whose key is id(observer)
+    :return None:
+    """
+    # Only remove the entry if it is still this observer's, not that of a later observer which reused its id
+    if handlers.get(ref.key, (None,))[0] is ref:
+        del handlers[ref.key]
+    return None
 
 
 class Subject:
     """
     Base class for all objects that will a Subject in an Observer design pattern.
     """
-    def __init__(self) -> None:
+    # '__weakref__' keeps subjects weakly referenceable, and so able to be observers too, when a child class uses slots
+    __slots__ = ('_handlers', '_dispatch', '_pending', '__weakref__')
+
+    def __init__(self, *args, **kwargs) -> None:
         """
+        Cooperative initializer: any arguments are passed along to the next class in the method resolution order,
+        so that a child class listing Subject before another base class, e.g., class W(Subject, ttk.Labelframe),
+        initializes both with a single super().__init__(...) call.
         """
-        self._observers = []
+        super().__init__(*args, **kwargs)
+        # Key=id(observer), Value=(weak reference to observer, function) pair. A dict keeps attach order, makes detach
+        # O(1), and ensures an observer attached twice is only notified once. Observers are held by weak reference,
+        # so that a subject does not keep an observer alive, and the weak reference removes the entry when the
+        # observer is garbage collected. notify() calls the function as function(observer, subject). It is resolved
+        # once at attach time, from the observer's update(...), the handler passed to attach(...), or the function
+        # passed to attach_function(...).
+        self._handlers = {}
+        # Tuple of (weak reference to observer, function) pairs that notify() iterates over. It is built on first use
+        # and cached until attach(...) or detach(...) changes the observers, so each notify() does not rebuild it.
+        self._dispatch = None
+        # True while a notification scheduled by notify_coalesced(...) has not yet run
+        self._pending = False
 
-    def attach(self, observer=None):
+    def attach(self, observer=None, handler=None):
         """
         Attach an observer to the subject.
         :parameter observer: Observer object, instance of Observer class 
+        :parameter handler: Optional callable that notify() will call directly in place of observer.update(...), and
+                            like update(...), with the notifying subject as its only argument. A handler that is a
+                            method of observer does not keep observer alive. Any other handler is held strongly by the
+                            subject, so it must not refer to observer, e.g., in a closure, otherwise observer is kept
+                            alive for as long as the subject.
+        :return None:
+        Raises TypeError if observer is not an Observer, or handler is not callable.
+        """
+        if observer:
+            # Type checks are skipped when Python runs optimized (-O)
+            if __debug__ and not isinstance(observer, Observer):
+                raise TypeError("observer must be an instance of Observer")
+            if handler is None:
+                func = type(observer).update
+            elif isinstance(handler, types.MethodType) and handler.__self__ is observer:
+                # Store the unbound function, rather than the bound method, so that observer is not kept alive
+                func = handler.__func__
+            else:
+                if __debug__ and not callable(handler):
+                    raise TypeError("handler must be callable")
+                func = lambda o, subject: handler(subject)
+            self._attach(observer, func)
+        return None
+
+    def attach_function(self, observer=None, function=None):
+        """
+        Attach an observer to the subject, with a function that notify() will call in place of observer.update(...),
+        as function(observer, subject). Unlike a handler passed to attach(...), function is passed the observer, so it
+        does not need to refer to it, and the observer is not kept alive. The subject holds function strongly, so it
+        must not capture observer, e.g., in a closure or a default argument.
+        :parameter observer: Observer object, instance of Observer class
+        :parameter function: Callable taking (observer, subject) arguments
         :return None:
+        Raises TypeError if observer is not an Observer, or function is not callable.
         """
         if observer:
-            assert(isinstance(observer, Observer))
-            self._observers.append(observer)
+            # Type checks are skipped when Python runs optimized (-O)
+            if __debug__ and not isinstance(observer, Observer):
+                raise TypeError("observer must be an instance of Observer")
+            if __debug__ and not callable(function):
+                raise TypeError("function must be callable")
+            self._attach(observer, function)
+        return None
+
+    def _attach(self, observer, func):
+        """
+        Utility function called by attach(...) and attach_function(...) to record observer, and the function that
+        notify() calls as func(observer, subject).
+        :parameter observer: Observer object, instance of Observer class
+        :parameter func: Callable taking (observer, subject) arguments
+        :return None:
+        """
+        key = id(observer)
+        handlers = self._handlers
+        ref, attached_func = handlers.get(key, (None, None))
+        if attached_func is func and ref() is observer:
+            # Already attached with func. Keep the entry, so that a notification in progress still updates observer.
+            return None
+        # The callback holds the handlers dict, rather than the subject, so that it does not keep the subject alive
+        ref = weakref.KeyedRef(observer, functools.partial(_drop_dead_handler, handlers), key)
+        handlers[key] = (ref, func)
+        self._dispatch = None
         return None
 
     def detach(self, observer=None):
         """
-        Detach an observer from the subject.
+        Detach an observer from the subject. Detaching an observer that is not attached does nothing.
         :parameter observer: Observer object, instance of Observer class 
         :return None:
         """
         if observer:
-            self._observers.remove(observer)
+            key = id(observer)
+            self._handlers.pop(key, None)
+            self._dispatch = None
         return None
 
     def notify(self):
         """
-        Call update(...) on all observers.
+        Call update(...), or the handler given to attach(...) or attach_function(...), on all (live) observers. Observers may attach(...)
+        or detach(...) during notification. An observer attached during notification is first updated by the next call
+        to notify(), and an observer detached during notification is not updated after it is detached, even if it is
+        attached again.
+        :return None:
+        """
+        handlers = self._handlers
+        # The dispatch table is immutable, so observers attaching or detaching in update(...) are safe.
+        for ref, handler in self._dispatch_table():
+            o = ref()
+            # Skip observers that have been garbage collected, or that were detached, or detached and attached again,
+            # during this notification
+            if o is not None and handlers.get(ref.key, (None,))[0] is ref:
+                handler(o, self)
+        return None
+
+    def notify_async(self, executor, done=None):
+        """
+        Like notify(), except that observers with async_safe set True are updated by submitting their update(...),
+        or attach(...) or attach_function(...) handler, to executor, so that a slow observer does not block the tkinter event loop.
+        Other observers are updated synchronously, as by notify().
+        :parameter executor: concurrent.futures.Executor, e.g., a ThreadPoolExecutor, on which to run async updates
+        :parameter done: Optional callable, which is passed the Future of each async update when it completes
+        :return: List of the concurrent.futures.Future instances of the async updates
+        """
+        futures = []
+        handlers = self._handlers
+        for ref, handler in self._dispatch_table():
+            o = ref()
+            if o is None or handlers.get(ref.key, (None,))[0] is not ref:
+                continue
+            if o.async_safe:
+                future = executor.submit(handler, o, self)
+                if done:
+                    future.add_done_callback(done)
+                futures.append(future)
+            else:
+                handler(o, self)
+        return futures
+
+    def _dispatch_table(self):
+        """
+        Utility function that returns the cached tuple of (weak reference to observer, function) pairs used by
+        notify() and notify_async(...), first building it if attach(...) or detach(...) has been called, or an observer
+        has been garbage collected, since it was last built.
+        :return: Tuple of (weakref.KeyedRef, function) pairs, in attach order
+        """
+        dispatch = self._dispatch
+        handlers = self._handlers
+        # attach(...) and detach(...) clear the cache, and only _drop_dead_handler(...) otherwise removes handlers, so
+        # a cache longer than handlers holds the handler of an observer that has been garbage collected
+        if dispatch is None or len(dispatch) != len(handlers):
+            dispatch = self._dispatch = tuple(handlers.values())
+        return dispatch
+
+    def notify_coalesced(self, widget):
+        """
+        Schedule notify() to be called when the tkinter event loop of widget is next idle. Calls made before then
+        are coalesced into that one notification, so a burst of changes in state updates the observers only once.
+        :parameter widget: tkinter widget (or any object with an after_idle(...) method) used to schedule notify()
+        :return None:
+        """
+        if not self._pending:
+            self._pending = True
+            widget.after_idle(self._notify_pending)
+        return None
+
+    def _notify_pending(self):
+        """
+        Utility function called from the tkinter event loop to run the notification scheduled by notify_coalesced(...).
         :return None:
         """
-        for o in self._observers:
-            o.update(self)
+        self._pending = False
+        self.notify()
         return None
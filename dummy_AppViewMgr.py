@@ -13,14 +13,13 @@ from tkViewManager import tkViewManager
 from ObserverPatternBase import Subject
 
 
-class TestWidget(ttk.LabelFrame, Subject):
+class TestWidget(Subject, ttk.LabelFrame):
     """
     Class represents a tkinter label frame widget, for testing tkViewManager.
     Class is also a Subject in Observer design pattern.
     """
     def __init__(self, parent) -> None:
-        ttk.Labelframe.__init__(self, parent, text='Test Widget')
-        Subject.__init__(self)
+        super().__init__(parent, text='Test Widget')
 
 
 class TesttkViewManager(tkViewManager):
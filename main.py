@@ -19,6 +19,7 @@ Exported Functions:
 
 
 # Standard
+import logging
 import tkinter as tk
 from tkinter import ttk
 
@@ -28,13 +29,26 @@ from ObserverPatternBase import Subject
 from model import Model
 import tkApp
 
+
+# The 'tkApp_logger' logger is configured by tkApp, at the log_level passed into tkApp.__init__(...)
+_logger = logging.getLogger('tkApp_logger')
+
+# Widget class used by DemoWidget.__init__, bound once here rather than looked up through the module per widget
+_Button = ttk.Button
+
+
 class DemoModel(Model):
     """
     A concrete implementation of Model for the demo application.
     """
-    def __init__(self) -> None:
+    def __init__(self, scheduler=None) -> None:
+        """
+        :parameter scheduler: Optional tkinter widget, whose event loop is used to coalesce a burst of changes to count
+                              into one notification of observers. If None, observers are notified of every change.
+        """
         super().__init__()
         self._count = 0
+        self._scheduler = scheduler
 
     @property
     def count(self):
@@ -42,29 +56,38 @@ class DemoModel(Model):
 
     @count.setter
     def count(self, value):
+        # Only notify observers of an actual change in state
+        if value == self._count:
+            return None
         self._count = value
-        self.notify()        
+        if self._scheduler is None:
+            self.notify()
+        else:
+            self.notify_coalesced(self._scheduler)
 
 
-class DemoWidget(ttk.LabelFrame, Subject):
+class DemoWidget(Subject, ttk.LabelFrame):
     """
     Class represents a tkinter label frame widget and is also a Subject in Observer design pattern.
     It has a button widget that will change it's text cyclicly from 'Start' to 'Stop' when clicked.
     """
+    # Button text to show after a click, indexed by the started state before the click (False=0, True=1)
+    _NEXT_LABEL = ('Stop', 'Start')
+
     def __init__(self, parent) -> None:
-        ttk.Labelframe.__init__(self, parent, text='Demo Widget')
-        Subject.__init__(self)
+        super().__init__(parent, text='Demo Widget')
         
-        btn = ttk.Button(self, command=self.OnButtonClicked)
+        # The button text is set directly, as it only changes in OnButtonClicked, so no StringVar is needed
+        btn = _Button(self, command=self.OnButtonClicked, text='Start')
+        self._btn = btn
         # Place button in grid and set weights for stretching the column and row in the grid
         # so that the demo widget resizes correctly.
         btn.grid(column=0, row=0)
         self.columnconfigure(0, weight=1)
         self.rowconfigure(0, weight=1)
-        # Create string variable which will be the text displayed on the button
-        self._lbl=tk.StringVar()
-        self._lbl.set('Start')
-        btn['textvariable']=self._lbl
+        # Bind methods used by OnButtonClicked once, rather than looking them up on every click
+        self._set_label = btn.configure
+        self._fire = self.notify
         
         self._is_started = False
 
@@ -81,20 +104,13 @@ class DemoWidget(ttk.LabelFrame, Subject):
         Event handler for button click.
         :return None:
         """
-        # Flip the started state
-        if self._is_started:
-            # Widget state is currently started, so change state to stopped
-            self._is_started = False
-            # Change button text to 'Start'
-            self._lbl.set('Start')
-        else:
-            # Widget state is currently stopped, so change it's state to started
-            self._is_started = True
-            # Change button text to 'Stop'
-            self._lbl.set('Stop')
+        # Flip the started state, and change the button text to match, by looking up the old state in _NEXT_LABEL
+        was_started = self._is_started
+        self._is_started = not was_started
+        self._set_label(text=self._NEXT_LABEL[was_started])
 
         # Notify observers
-        self.notify()
+        self._fire()
 
         return None
 
@@ -110,9 +126,7 @@ class DemotkViewManager(tkViewManager):
         :return None:
         """
         dw = DemoWidget(self)
-        # Attach self as an observer of the subject demo widget
-        dw.attach(self)
-        # Register a handler function for updates from the subject demo widget
+        # Register a handler function for updates from the subject demo widget, which also attaches self as an observer
         self.register_subject(dw,self.handle_demo_widget_update)
         # Place demo widget in grid and set weights for stretching the column and row in the grid
         # so that the demo widget resizes correctly.
@@ -126,7 +140,9 @@ class DemotkViewManager(tkViewManager):
         Handle updates from the model.
         :return None:
         """
-        print(f"Model count of button clicks is {self.getModel().count}")
+        # Lazy %-formatting, so the message is only built when debug logging is enabled, e.g., by passing
+        # log_level=logging.DEBUG into tkApp.__init__(...)
+        _logger.debug("Model count of button clicks is %d", self.getModel().count)
         return None
     
     def handle_demo_widget_update(self):
@@ -145,9 +161,12 @@ class DemotkApp(tkApp.tkApp):
     Provide implementations of _createViewManager() and _createModel() factory methods.
     """
     def __init__(self, parent):
-        info = tkApp.AppAboutInfo(name='Demo Application', version='0.1', copyright='2025', author='John Q. Public',
-                                  license='MIT License', source='GitHub', help_file='.\\Help\\HelpFile.txt')
-        super().__init__(parent, title="Demo Application", app_info=info, file_types=[('Text file', '*.txt')])
+        # The "About" information is only created when it is first needed
+        info_factory = lambda: tkApp.AppAboutInfo(name='Demo Application', version='0.1', copyright='2025',
+                                                  author='John Q. Public', license='MIT License', source='GitHub',
+                                                  help_file='.\\Help\\HelpFile.txt')
+        super().__init__(parent, title="Demo Application", app_info_factory=info_factory,
+                         file_types=[('Text file', '*.txt')])
 
     def _createViewManager(self):
         """
@@ -158,10 +177,10 @@ class DemotkApp(tkApp.tkApp):
 
     def _createModel(self):
         """
-        Concrete Implementation, which returns a DemoModel().
+        Concrete Implementation, which returns a DemoModel(), which coalesces its notifications using the app's event loop.
         :return: DemoModel instance that will be the app's model
         """
-        return DemoModel()
+        return DemoModel(self)
 
 
 if __name__ == '__main__':
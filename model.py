@@ -39,6 +39,8 @@ class Model(Subject):
             (b) After reading from a file, the model should call self.notify() to inform observers of changes.
         (2) Implement writeModelToFile() method for writing model data to a file-like object.
     """
+    __slots__ = ()
+
     def __init__(self) -> None:
         """Initialize the Model."""
         super().__init__()
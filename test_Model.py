@@ -5,6 +5,7 @@ This module provides unit tests for Model class.
 
 # Standard
 import unittest
+import weakref
 
 # Local
 from model import Model
@@ -14,9 +15,13 @@ class Test_Model(unittest.TestCase):
     def test_init(self):
         mod = Model()
         exp_val = 0
-        act_val = len(mod._observers)
+        act_val = len(mod._handlers)
         self.assertEqual(exp_val, act_val)
 
+    def test_weakref(self):
+        mod = Model()
+        self.assertIs(weakref.ref(mod)(), mod)
+
     def test_readModelFromFile_not_implemented(self):
         mod = Model()
         self.assertRaises(NotImplementedError, mod.readModelFromFile, None, None)
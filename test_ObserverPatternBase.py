@@ -6,37 +6,249 @@ This module provides unit tests for:
 
 # Standard imports
 import unittest
+import functools
+import gc
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 # Local imports
 from ObserverPatternBase import Subject, Observer
 
 
+class CountingObserver(Observer):
+    """
+    Concrete Observer that counts how many times it has been updated, to facilitate unit testing.
+    """
+    def __init__(self):
+        super().__init__()
+        self.count = 0
+
+    def update(self, subject):
+        self.count += 1
+        return None
+
+    def handle_update(self, subject):
+        self.count += 10
+        return None
+
+
 class Test_Subject(unittest.TestCase):
     def test_attach_notify_detach(self):
-        obs = Observer()
+        obs = CountingObserver()
         sub = Subject()
         sub.attach(obs)
-        self.assertTrue(sub._observers.index(obs)>=0)
-        self.assertRaises(NotImplementedError, sub.notify)
+        self.assertIs(sub._handlers[id(obs)][0](), obs)
+        sub.notify()
+        self.assertEqual(obs.count, 1)
         sub.detach(obs)
-        self.assertRaises(ValueError, sub._observers.index, obs)
+        self.assertNotIn(id(obs), sub._handlers)
+
+    def test_attach_twice(self):
+        obs = CountingObserver()
+        sub = Subject()
+        sub.attach(obs)
+        sub.attach(obs)
+        self.assertEqual(len(sub._handlers), 1)
+        sub.notify()
+        self.assertEqual(obs.count, 1)
+
+    def test_attach_with_handler(self):
+        obs = CountingObserver()
+        sub = Subject()
+        sub.attach(obs, obs.handle_update)
+        sub.notify()
+        self.assertEqual(obs.count, 10)
+        # Re-attaching without a handler restores dispatch through update(...)
+        sub.attach(obs)
+        sub.notify()
+        self.assertEqual(obs.count, 11)
+
+    def test_attach_with_callable_handler(self):
+        obs = CountingObserver()
+        sub = Subject()
+        sub.attach(obs, functools.partial(obs.handle_update))
+        sub.notify()
+        self.assertEqual(obs.count, 10)
+
+    def test_attach_with_foreign_handler(self):
+        obs = CountingObserver()
+        other = CountingObserver()
+        sub = Subject()
+        # A method of another object is also called with the subject alone
+        sub.attach(obs, other.handle_update)
+        sub.notify()
+        self.assertEqual(other.count, 10)
+        self.assertEqual(obs.count, 0)
+
+    def test_attach_noncallable_handler(self):
+        obs = CountingObserver()
+        sub = Subject()
+        self.assertRaises(TypeError, sub.attach, obs, 'handler')
+
+    def test_attach_function(self):
+        calls = []
+        obs = CountingObserver()
+        sub = Subject()
+        sub.attach_function(obs, lambda observer, subject: calls.append((observer, subject)))
+        sub.notify()
+        self.assertEqual(calls, [(obs, sub)])
+        self.assertEqual(obs.count, 0)
+
+    def test_detach_during_notify(self):
+        class DetachingObserver(CountingObserver):
+            def update(self, subject):
+                super().update(subject)
+                subject.detach(self)
+        obs1 = DetachingObserver()
+        obs2 = DetachingObserver()
+        sub = Subject()
+        sub.attach(obs1)
+        sub.attach(obs2)
+        sub.notify()
+        self.assertEqual(obs1.count, 1)
+        self.assertEqual(obs2.count, 1)
+        self.assertEqual(len(sub._handlers), 0)
+
+    def test_detach_other_during_notify(self):
+        class DetachingObserver(CountingObserver):
+            def update(self, subject):
+                super().update(subject)
+                subject.detach(self.other)
+        obs1 = DetachingObserver()
+        obs2 = CountingObserver()
+        obs1.other = obs2
+        sub = Subject()
+        sub.attach(obs1)
+        sub.attach(obs2)
+        sub.notify()
+        self.assertEqual(obs1.count, 1)
+        self.assertEqual(obs2.count, 0)
+
+    def test_attach_during_notify(self):
+        class AttachingObserver(CountingObserver):
+            def update(self, subject):
+                super().update(subject)
+                subject.attach(self.other)
+        obs1 = AttachingObserver()
+        obs2 = CountingObserver()
+        obs1.other = obs2
+        sub = Subject()
+        sub.attach(obs1)
+        sub.notify()
+        self.assertEqual(obs2.count, 0)
+        sub.notify()
+        self.assertEqual(obs1.count, 2)
+        self.assertEqual(obs2.count, 1)
+
+    def test_reattach_during_notify(self):
+        class ReattachingObserver(CountingObserver):
+            def update(self, subject):
+                super().update(subject)
+                if self.count == 1:
+                    subject.detach(self.other)
+                    subject.attach(self.other, self.other.handle_update)
+        obs1 = ReattachingObserver()
+        obs2 = CountingObserver()
+        obs1.other = obs2
+        sub = Subject()
+        sub.attach(obs1)
+        sub.attach(obs2)
+        sub.notify()
+        # obs2 was re-attached during the notification, so it is first updated, by its new handler, by the next one
+        self.assertEqual(obs2.count, 0)
+        sub.notify()
+        self.assertEqual(obs2.count, 10)
+
+    def test_observer_not_kept_alive(self):
+        obs = CountingObserver()
+        sub = Subject()
+        sub.attach(obs)
+        key = id(obs)
+        del obs
+        gc.collect()
+        self.assertNotIn(key, sub._handlers)
+        self.assertIsNone(sub.notify())
+
+    def test_handler_not_kept_after_observer_collected(self):
+        sub = Subject()
+        for i in range(10):
+            sub.attach_function(CountingObserver(), lambda observer, subject: None)
+        sub.notify()
+        gc.collect()
+        self.assertEqual(len(sub._handlers), 0)
+        self.assertEqual(len(sub._dispatch_table()), 0)
+
+    def test_attach_slotted_observer(self):
+        class SlottedObserver(Subject, Observer):
+            __slots__ = ()
+            def update(self, subject):
+                return None
+        obs = SlottedObserver()
+        sub = Subject()
+        sub.attach(obs)
+        self.assertIsNone(sub.notify())
+
+    def test_notify_coalesced(self):
+        class IdleScheduler:
+            def __init__(self):
+                self.callbacks = []
+            def after_idle(self, func):
+                self.callbacks.append(func)
+        scheduler = IdleScheduler()
+        obs = CountingObserver()
+        sub = Subject()
+        sub.attach(obs)
+        sub.notify_coalesced(scheduler)
+        sub.notify_coalesced(scheduler)
+        self.assertEqual(len(scheduler.callbacks), 1)
+        self.assertEqual(obs.count, 0)
+        scheduler.callbacks.pop()()
+        self.assertEqual(obs.count, 1)
+        sub.notify_coalesced(scheduler)
+        self.assertEqual(len(scheduler.callbacks), 1)
+
+    def test_notify_async(self):
+        class ThreadRecordingObserver(CountingObserver):
+            async_safe = True
+            def update(self, subject):
+                super().update(subject)
+                self.thread = threading.current_thread()
+        sync_obs = CountingObserver()
+        async_obs = ThreadRecordingObserver()
+        sub = Subject()
+        sub.attach(sync_obs)
+        sub.attach(async_obs)
+        done = []
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            futures = sub.notify_async(executor, done.append)
+        self.assertEqual(len(futures), 1)
+        self.assertEqual(done, futures)
+        self.assertEqual(sync_obs.count, 1)
+        self.assertEqual(async_obs.count, 1)
+        self.assertIsNot(async_obs.thread, threading.current_thread())
 
     def test_attach_nonobserver(self):
         obs = Subject()
         sub = Subject()
-        self.assertRaises(AssertionError, sub.attach, obs)
+        self.assertRaises(TypeError, sub.attach, obs)
 
     def test_detach_missing_observer(self):
-        obs = Observer()
+        obs = CountingObserver()
         sub = Subject()
-        self.assertRaises(ValueError, sub.detach, obs)
+        self.assertIsNone(sub.detach(obs))
+
+    def test_detach_twice(self):
+        obs = CountingObserver()
+        sub = Subject()
+        sub.attach(obs, obs.handle_update)
+        sub.detach(obs)
+        self.assertIsNone(sub.detach(obs))
+        self.assertEqual(len(sub._handlers), 0)
 
 
 class Test_Observer(unittest.TestCase):
-    def test_update(self):
-        obs = Observer()
-        sub = Subject()
-        self.assertRaises(NotImplementedError, obs.update, sub)
+    def test_update_not_implemented(self):
+        self.assertRaises(TypeError, Observer)
 
 
 if __name__ == '__main__':
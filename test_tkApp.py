@@ -4,6 +4,9 @@ This module provides unit tests for tkApp class.
 
 
 # Standard
+from dataclasses import dataclass
+import logging
+import time
 import unittest
 import tkinter as tk
 
@@ -11,6 +14,7 @@ import tkinter as tk
 from dummy_AppViewMgr import TesttkApp, TesttkViewManager
 from model import Model
 from tkApp import AppAboutInfo
+from ObserverPatternBase import Subject, Observer
 
 
 class Test_tkApp(unittest.TestCase):
@@ -30,5 +34,103 @@ class Test_tkApp(unittest.TestCase):
         self.assertTupleEqual(app.getAboutInfo(), info)
 
 
+    def test_getAppInfo_factory(self):
+        root = tk.Tk()
+        info = AppAboutInfo(name='Test App', version='1.0', copyright='2025', author='Tester', license='MIT', source='local repo')
+        calls = []
+        def factory():
+            calls.append(1)
+            return info
+        app = TesttkApp(root, title='Test App', app_info_factory=factory, log_level=logging.DEBUG)
+        self.assertEqual(len(calls), 0)
+        self.assertTupleEqual(app.getAboutInfo(), info)
+        self.assertTupleEqual(app.getAboutInfo(), info)
+        self.assertEqual(len(calls), 1)
+
+    def test_notifyAsync(self):
+        class AsyncObserver(Observer):
+            async_safe = True
+            def update(self, subject):
+                return None
+        root = tk.Tk()
+        app = TesttkApp(root, title='Test App')
+        # Nothing is drained until there are async updates
+        self.assertIsNone(app._drain_after_id)
+        sub = Subject()
+        obs = AsyncObserver()
+        sub.attach(obs)
+        futures = app.notifyAsync(sub)
+        self.assertEqual(len(futures), 1)
+        self.assertIsNotNone(app._drain_after_id)
+        # Run the event loop until the update is drained
+        deadline = time.monotonic() + 5
+        while app._drain_after_id is not None and time.monotonic() < deadline:
+            root.update()
+        # All updates drained, so draining stops
+        self.assertEqual(app._async_outstanding, 0)
+        self.assertIsNone(app._drain_after_id)
+
+    def test_getAppInfo_none(self):
+        root = tk.Tk()
+        app = TesttkApp(root, title='Test App', app_info=None)
+        self.assertIsNone(app.getAboutInfo())
+
+    def test_menu_labels(self):
+        root = tk.Tk()
+        # Labels with characters that are special in Tcl scripts, or are outside the BMP
+        labels = ['Save As...', 'open {brace', '[exit]', '$HOME', 'two\nlines', 'back\\slash', '\U0001F600 Save', 'null\x00char']
+        app = TesttkApp(root, title='Test App', menu_dict={label:(lambda: None) for label in labels})
+        self.assertEqual(app._menubar.index('end'), len(labels)-1)
+        for i, label in enumerate(labels):
+            self.assertEqual(app._menubar.entrycget(i, 'label'), label)
+
+    def test_cascade_populated_lazily(self):
+        root = tk.Tk()
+        app = TesttkApp(root, title='Test App',
+                        menu_dict={'File':{'Open':lambda: None, 'More':{'Deep':lambda: None}}})
+        file_menu = app.nametowidget(app._menubar.entrycget(0, 'menu'))
+        # The cascade is empty until it is posted (opened)
+        self.assertIsNone(file_menu.index('end'))
+        file_menu.tk.eval(file_menu['postcommand'])
+        self.assertEqual(file_menu.index('end'), 1)
+        self.assertEqual(file_menu.entrycget(0, 'label'), 'Open')
+        # The postcommand is cleared, so that the cascade is only populated once
+        self.assertEqual(str(file_menu['postcommand']), '')
+        # The nested cascade is populated lazily too
+        more_menu = app.nametowidget(file_menu.entrycget(1, 'menu'))
+        self.assertIsNone(more_menu.index('end'))
+        more_menu.tk.eval(more_menu['postcommand'])
+        self.assertEqual(more_menu.index('end'), 0)
+        self.assertEqual(more_menu.entrycget(0, 'label'), 'Deep')
+
+    def test_menu_commands_shared(self):
+        root = tk.Tk()
+        app = TesttkApp(root, title='Test App')
+        menu_dict = {'Save':app.onFileSave, 'Save Again':app.onFileSave, 'Open':app.onFileOpen}
+        app._setup_menu(menu_dict, app._menubar)
+        first = app._menubar.index('end') - 2
+        # Items with the same action share a Tcl command, and an item with a different action does not
+        self.assertEqual(app._menubar.entrycget(first, 'command'), app._menubar.entrycget(first+1, 'command'))
+        self.assertNotEqual(app._menubar.entrycget(first, 'command'), app._menubar.entrycget(first+2, 'command'))
+
+    def test_menu_command_unhashable(self):
+        @dataclass
+        class Action:
+            calls: int = 0
+            def __call__(self):
+                self.calls += 1
+        root = tk.Tk()
+        action = Action()
+        app = TesttkApp(root, title='Test App', menu_dict={'Act':action})
+        app._menubar.invoke(0)
+        self.assertEqual(action.calls, 1)
+
+    def test_empty_cascade_skipped(self):
+        root = tk.Tk()
+        app = TesttkApp(root, title='Test App', menu_dict={'File':{'Exit':lambda: None}, 'Empty':{}})
+        self.assertEqual(app._menubar.index('end'), 0)
+        self.assertEqual(app._menubar.entrycget(0, 'label'), 'File')
+
+
 if __name__ == '__main__':
     unittest.main()
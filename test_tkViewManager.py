@@ -28,16 +28,81 @@ class Test_tkViewManager(unittest.TestCase):
         vm.register_subject(cw,vm.handle_test_widget_update)
         self.assertTrue(vm._subjects.__contains__(cw))
 
+    def test_register_subjects(self):
+        root = tk.Tk()
+        app = TesttkApp(root, title='Test App')
+        vm = app._view_manager
+        cw1 = TestWidget(vm)
+        cw2 = TestWidget(vm)
+        vm.register_subjects([(cw1, vm.handle_test_widget_update), (cw2, vm.handle_test_widget_update)])
+        self.assertIn(cw1, vm._subjects)
+        self.assertIn(cw2, vm._subjects)
+        self.assertIs(cw2._handlers[id(vm)][0](), vm)
+        self.assertRaises(NotImplementedError, cw1.notify)
+
+    def test_register_subject_attaches(self):
+        root = tk.Tk()
+        app = TesttkApp(root, title='Test App')
+        vm = app._view_manager
+        cw = TestWidget(vm)
+        vm.register_subject(cw,vm.handle_test_widget_update)
+        self.assertIs(cw._handlers[id(vm)][0](), vm)
+        # The handler is called directly by notify()
+        self.assertRaises(NotImplementedError, cw.notify)
+
+    def test_register_subject_coalesce(self):
+        root = tk.Tk()
+        app = TesttkApp(root, title='Test App')
+        vm = app._view_manager
+        cw = TestWidget(vm)
+        calls = []
+        vm.register_subject(cw, lambda: calls.append(cw), coalesce=True)
+        cw.notify()
+        cw.notify()
+        self.assertEqual(len(calls), 0)
+        root.update_idletasks()
+        self.assertEqual(calls, [cw])
+
+    def test_onDestroy_cancels_coalesced(self):
+        root = tk.Tk()
+        app = TesttkApp(root, title='Test App')
+        vm = app._view_manager
+        cw = TestWidget(vm)
+        calls = []
+        vm.register_subject(cw, lambda: calls.append(cw), coalesce=True)
+        cw.notify()
+        self.assertIsNotNone(vm._idle_after_id)
+        vm.destroy()
+        self.assertIsNone(vm._idle_after_id)
+        root.update_idletasks()
+        self.assertEqual(len(calls), 0)
+
     def test_detach(self):
         root = tk.Tk()
         app = TesttkApp(root, title='Test App')
         vm = app._view_manager
         cw = TestWidget(vm)
         cw.attach(vm)
-        self.assertTrue(len(cw._observers)==1)
+        self.assertTrue(len(cw._handlers)==1)
         vm.register_subject(cw,vm.handle_test_widget_update)
         vm._detach_from_subjects()
-        self.assertTrue(len(cw._observers)==0)
+        self.assertTrue(len(cw._handlers)==0)
+
+    def test_onDestroy(self):
+        root = tk.Tk()
+        app = TesttkApp(root, title='Test App')
+        vm = app._view_manager
+        cw = TestWidget(vm)
+        vm.register_subject(cw,vm.handle_test_widget_update)
+        # A subject widget that is not a descendant of the view manager, and so outlives it
+        ow = TestWidget(app)
+        vm.register_subject(ow,vm.handle_test_widget_update)
+        vm.destroy()
+        self.assertEqual(len(vm._subjects), 0)
+        self.assertNotIn(id(vm), app._model._handlers)
+        self.assertNotIn(id(vm), ow._handlers)
+        # Notifying no longer calls the view manager's handler
+        ow.notify()
 
     def test_update(self):
         root = tk.Tk()
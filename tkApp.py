@@ -34,8 +34,12 @@ Logging:
 
 # standard imports
 from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 import os
+from os.path import dirname, splitext
 import logging
+import queue
+import re
 import tkinter as tk
 from tkinter import ttk
 from tkinter.messagebox import showinfo
@@ -63,12 +67,40 @@ def _launch_help_app(help_file = ''):
     return None
 
 
+# Characters that _tcl_word(...) writes as Tcl backslash sequences, rather than as a backslash followed by the character
+_TCL_ESCAPES = {'\n': '\\n', '\x00': '\\000'}
+
+
+def _tcl_word(value):
+    """
+    Quote a value as a single word of a Tcl script, which Tcl substitutes back to the value's string when it
+    evaluates the script. Every ASCII character other than a letter, digit or underscore is backslash escaped, and
+    newline and null characters are written as the \\n and \\000 backslash sequences (a backslash followed by a newline
+    would join lines, and a script cannot contain a null character). Non-ASCII characters, which Tcl never treats
+    specially, are left as they are, since Tcl does not substitute a backslash followed by a character outside the BMP
+    (e.g., an emoji) back to that character.
+    :parameter value: The value to quote, which is converted to a string
+    :return: The quoted Tcl word, string
+    """
+    return re.sub(r'[^\w\u0080-\U0010FFFF]', lambda m: _TCL_ESCAPES.get(m.group(), '\\' + m.group()), str(value)) or '{}'
+
+
 # Named tuple to hold the "About" information of the app.
 AppAboutInfo = namedtuple('AppAboutInfo', ['name', 'version', 'copyright', 'author', 'license', 'source', 'help_file'],
                           defaults = {'name':'my app', 'version':'X.X', 'copyright':'20XX', 'author':'John Q. Public',
                                       'license':'MIT License', 'source':'github url', 'help_file':''})
 
 
+# Buffer size, in bytes, for files the model reads from or writes to, so that large models take fewer system calls
+_FILE_BUFFER_SIZE = 1 << 20
+
+
+# Default menubar of the app, used by tkApp.__init__(...) when menu_dict is empty:
+# {cascade menu text string : {menu text string : name of the tkApp handler method}}
+_DEFAULT_MENU_TEMPLATE = {'File':{'Open...':'onFileOpen', 'Save':'onFileSave', 'Save As...':'onFileSaveAs', 'Exit':'onFileExit'},
+                          'Help':{'View Help...':'onViewHelp', 'About...':'onHelpAbout'}}
+
+
 # TODO: Refctor the way the menubar is created, so that File|Exit and Help|About are always present. If the
 # user provides a non-empty menu_dict, and it contains File|Exit or Help|About, then use the user's handler.
 # If the user provides an empty menu_dict, or a non-empty menu_dict that does not contain File|Exit or Help|About,
@@ -90,13 +122,13 @@ class tkApp(ttk.Frame):
     Concrete implementation child classes may:
         (7) Extend _setup_child_widgets() if the tkViewManager does not create all of the app's widgets
     """
-    def __init__(self, parent, title = '', menu_dict = {}, app_info = AppAboutInfo(), file_types=[],
-                 log_level = logging.INFO) -> None:
+    def __init__(self, parent, title = '', menu_dict = None, app_info = AppAboutInfo(), file_types = None,
+                 log_level = logging.INFO, app_info_factory = None) -> None:
         """
         :parameter title: The title of the application, to appear on the app's main window, string
         :parameter menu_dict: A dictionary describing the app's menubar:
             {menu text string : handler callable or another menu_dict if there is a cascade}
-            If menu_dict is empty, then the menubar will only have:
+            If menu_dict is empty or None, then the menubar will only have:
                 (a) File|Open... which will call OnFileOpen
                 (b) File|Save which will call OnFileSave
                 (c) File|Save As... which will call OnFileSaveAs
@@ -109,13 +141,22 @@ class tkApp(ttk.Frame):
             ('my app', 'X.X', '20XX', 'John Q. Public', 'MIT License', 'github url')
         :parameter file_types: A list of file type tuples for saving and opening, in this format:
             [('Description1', '*.ext1'), ('Description2', '*.ext2'), ...]
+            If None, there are no file types.
         :param log_level: The logging level to set for the logger, e.g., logging.DEBUG, logging.INFO, etc.
+        :parameter app_info_factory: Optional callable, taking no arguments, that returns the app's AppAboutInfo.
+            If provided, it is used instead of app_info, and is only called when the "About" information is first
+            needed, via getAboutInfo().
         """
         super().__init__(parent)
 
-        self._appInfo = app_info
-        self._fileTypes = list(file_types) # List of file extensions for file dialogs
+        # If there is a factory, the "About" information is created on first call to getAboutInfo()
+        self._appInfoFactory = app_info_factory
+        self._appInfo = None if app_info_factory else app_info
+        self._fileTypes = list(file_types) if file_types else [] # List of file extensions for file dialogs
         self._savePath = '' # Path of last save, empty string if never saved
+        self._defaultExt = self._fileTypes[0][1] if self._fileTypes else '' # Default extension for file dialogs
+        self._initialDir = os.getcwd() # Initial directory for file dialogs, until there is a save path
+        self._menuCommands = {} # Key=menu action callable, Value=name of the Tcl command registered to call it
 
         self.grid(column=0, row=0, sticky='NWES') # Grid-0
         # Weights control the relative "stretch" of each column and row as the frame is resized
@@ -125,32 +166,31 @@ class tkApp(ttk.Frame):
         parent.title(title)
 
         # Create and setup a menubar for the app
-        if len(menu_dict)==0:
-            # menu_dict is empty, so just set up File | [Open, Save, Save As, Exit] and Help | [View Help, About] by default
-            file_menu_dict={}
-            file_menu_dict['Open...']=self.onFileOpen
-            file_menu_dict['Save']=self.onFileSave
-            file_menu_dict['Save As...']=self.onFileSaveAs
-            file_menu_dict['Exit']=self.onFileExit
-            help_menu_dict={}
-            help_menu_dict['View Help...']=self.onViewHelp
-            help_menu_dict['About...']=self.onHelpAbout
-            menu_dict['File']=file_menu_dict
-            menu_dict['Help']=help_menu_dict
+        if not menu_dict:
+            # menu_dict is empty or None, so just set up File | [Open, Save, Save As, Exit] and Help | [View Help, About]
+            # by default, building a new dict of this app's handler methods from _DEFAULT_MENU_TEMPLATE
+            menu_dict = {cascade_label: {label: getattr(self, handler_name) for label, handler_name in cascade.items()}
+                         for cascade_label, cascade in _DEFAULT_MENU_TEMPLATE.items()}
         self._setup_menubar(menu_dict)
 
         # Create and initialize the model of the app
         self._model = self._createModel()
         
-        # Create and setup the child widgets of the app, including the view manager self._view_manager
+        # Create and setup the child widgets of the app, including the view manager self._view_manager,
+        # which registers itself as an observer of the model
         self._setup_child_widgets()
-
-        # Attach view manager as observer of model
-        self._model.attach(self._view_manager)
         
         # Process running the HelpApp
         self._help_process = None
 
+        # Worker threads on which notifyAsync(...) runs async_safe observer updates, and a queue of the completed
+        # updates, which the event loop drains periodically while any are outstanding. Threads are only started once
+        # an update is submitted.
+        self._executor = ThreadPoolExecutor(thread_name_prefix='tkApp')
+        self._async_done = queue.Queue()
+        self._async_outstanding = 0 # Number of async updates submitted, but not yet drained from _async_done
+        self._drain_after_id = None # Set while a call of _drain_async_updates() is scheduled
+
         # If the user X's the main window, make sure we clean up 
         parent.protocol("WM_DELETE_WINDOW", self.onFileExit)
 
@@ -159,7 +199,13 @@ class tkApp(ttk.Frame):
         
         # Get the logger 'tkApp_logger'
         logger = logging.getLogger('tkApp_logger')
-        logger.debug(f"Starting {self._appInfo.name} version {self._appInfo.version}")
+        if logger.isEnabledFor(logging.DEBUG):
+            # Don't call app_info_factory here, so that the "About" information stays lazy even when logging at DEBUG
+            info = self._appInfo
+            if info is None:
+                logger.debug(f"Starting {title}")
+            else:
+                logger.debug(f"Starting {info.name} version {info.version}")
 
     def getModel(self):
         """
@@ -167,8 +213,48 @@ class tkApp(ttk.Frame):
         :return: The model of the app, instance of Model
         """
         return self._model
+
+    def notifyAsync(self, subject):
+        """
+        Notify the observers of subject, by calling subject.notify_async(...) with the app's worker threads, so that
+        observers with async_safe set True are updated off of the tkinter event loop. Exceptions raised by those
+        updates are logged to 'tkApp_logger' from the event loop.
+        :parameter subject: The Subject whose observers should be notified, e.g., the model of the app
+        :return: List of the concurrent.futures.Future instances of the async updates
+        """
+        futures = subject.notify_async(self._executor, self._async_done.put)
+        if futures:
+            self._async_outstanding += len(futures)
+            # Start draining the completed updates, unless already doing so
+            if self._drain_after_id is None:
+                self._drain_after_id = self.after(50, self._drain_async_updates)
+        return futures
+
+    def _drain_async_updates(self):
+        """
+        Utility function, run periodically by the tkinter event loop while async updates are outstanding, that collects
+        the async updates completed since it last ran, and logs any exceptions they raised.
+        :return: None
+        """
+        logger = logging.getLogger('tkApp_logger')
+        while True:
+            try:
+                future = self._async_done.get_nowait()
+            except queue.Empty:
+                break
+            self._async_outstanding -= 1
+            if not future.cancelled():
+                exception = future.exception()
+                if exception is not None:
+                    logger.error(f"Async observer update raised {exception!r}")
+        # Stop running once every submitted update has been drained, until notifyAsync(...) submits more
+        if self._async_outstanding:
+            self._drain_after_id = self.after(50, self._drain_async_updates)
+        else:
+            self._drain_after_id = None
+        return None
         
-    def _setup_menubar(self, menu_dict={}):
+    def _setup_menubar(self, menu_dict=None):
         """
         Utility function to be called by __init__ to set up the menu bar of the app.
         :parameter menu_dict: A dictionary describing the app's menubar:
@@ -180,25 +266,60 @@ class tkApp(ttk.Frame):
         self._setup_menu(menu_dict, self._menubar)
         return None
 
-    def _setup_menu(self, menu_dict={}, add_to_menu=None):
+    def _setup_menu(self, menu_dict=None, add_to_menu=None):
         """
-        Utility function to be called by _setup_menubar(...) to set up one cascade menu. Designed to be called
-        recursively as needed.
+        Utility function to be called by _setup_menubar(...) to set up one cascade menu. The items of any cascade
+        within it are not added until that cascade is first opened, see _populate_menu(...).
         :parameter menu_dict: A dictionary describing a cascade menu:
             {menu text string : handler callable or another menu_dict if there is another cascade}
+            Cascades whose menu_dict is empty are left out.
         :parameter add_to_menu: The cascade menu object to which the next cascade or action should be added
         :return: None
         """
-        for menu_label in menu_dict:
-            menu_action = menu_dict[menu_label]
-            if type(menu_action) is dict:
-                # Set up a cascade
+        if not menu_dict:
+            return None
+        # Add all of the items with one Tcl script, rather than with a Python to Tcl call per item
+        menu_path = str(add_to_menu)
+        populate_menu = self._populate_menu
+        menu_commands = self._menuCommands
+        script = []
+        for menu_label, menu_action in menu_dict.items():
+            label = _tcl_word(menu_label)
+            if isinstance(menu_action, dict):
+                if not menu_action:
+                    # A cascade with no items is left out of the menu, rather than creating a menu object for it
+                    continue
+                # Set up an empty cascade, which will be populated just before it is first posted (opened)
                 menu_obj=tk.Menu(add_to_menu)
-                add_to_menu.add_cascade(menu=menu_obj, label=menu_label)
-                self._setup_menu(menu_action, menu_obj)
+                menu_obj['postcommand'] = lambda m=menu_obj, d=menu_action: populate_menu(m, d)
+                script.append(f"{menu_path} add cascade -label {label} -menu {menu_obj}")
             else:
                 assert(callable(menu_action))
-                add_to_menu.add_command(label=menu_label, command=menu_action)
+                # register(...) creates a Tcl command that calls menu_action, as add_command(...) would do. Menu items
+                # with equal actions share one Tcl command.
+                try:
+                    command = menu_commands.get(menu_action)
+                except TypeError:
+                    # menu_action is unhashable, e.g., a callable dataclass instance, so it gets its own Tcl command
+                    command = _tcl_word(self.register(menu_action))
+                if command is None:
+                    command = menu_commands[menu_action] = _tcl_word(self.register(menu_action))
+                script.append(f"{menu_path} add command -label {label} -command {command}")
+        if script:
+            self.tk.eval('\n'.join(script))
+        return None
+
+    def _populate_menu(self, menu_obj, menu_dict):
+        """
+        Utility function called via the postcommand of a cascade menu created by _setup_menu(...), when the cascade
+        is about to be posted (opened), to add its items. Only the first call does anything.
+        :parameter menu_obj: The cascade menu object to populate
+        :parameter menu_dict: A dictionary describing the cascade menu, as for _setup_menu(...)
+        :return: None
+        """
+        # Clear the postcommand, so that the cascade is populated only once
+        menu_obj['postcommand'] = ''
+        self._setup_menu(menu_dict, menu_obj)
         return None
 
     def _setup_child_widgets(self):
@@ -243,6 +364,8 @@ class tkApp(ttk.Frame):
             Example:
             ('my app', 'X.X', '20XX', 'John Q. Public', 'MIT License', 'github url')
         """
+        if self._appInfo is None and self._appInfoFactory:
+            self._appInfo = self._appInfoFactory()
         return self._appInfo
     
     def onFileOpen(self):
@@ -251,17 +374,13 @@ class tkApp(ttk.Frame):
         then opening that path for read, and calling the model's readModelFromFile(...) method.
         :return: None
         """
-        initial_dir = None
-        if len(self._savePath)>0:
-            initial_dir = os.path.dirname(self._savePath)
-        else:
-            initial_dir = os.getcwd()
+        initial_dir = dirname(self._savePath) if self._savePath else self._initialDir
         # Pop up tkFileDialog for open
-        response = filedialog.askopenfilename(defaultextension=self._fileTypes[0][1], filetypes=self._fileTypes,
+        response = filedialog.askopenfilename(defaultextension=self._defaultExt, filetypes=self._fileTypes,
                                               initialdir=initial_dir, title='Select file to open')
         if len(response)>0: # User did not cancel
-            with open(response) as f:
-                self._model.readModelFromFile(f, os.path.splitext(response)[1])
+            with open(response, buffering=_FILE_BUFFER_SIZE) as f:
+                self._model.readModelFromFile(f, splitext(response)[1])
                 self._savePath = response
         return None
 
@@ -272,9 +391,9 @@ class tkApp(ttk.Frame):
         because there has not been a previous open or save as, then do nothing.
         :return: None
         """
-        if len(self._savePath)>0:
-            with open(self._savePath, mode='w') as f:
-                self._model.writeModelToFile(f, os.path.splitext(self._savePath)[1])
+        if self._savePath:
+            with open(self._savePath, mode='w', buffering=_FILE_BUFFER_SIZE) as f:
+                self._model.writeModelToFile(f, splitext(self._savePath)[1])
         return None
 
     def onFileSaveAs(self):
@@ -283,17 +402,13 @@ class tkApp(ttk.Frame):
         then opening that path for write, and calling the model's writeModelToFile(...) method.
         :return: None
         """
-        initial_dir = None
-        if len(self._savePath)>0:
-            initial_dir = os.path.dirname(self._savePath)
-        else:
-            initial_dir = os.getcwd()
+        initial_dir = dirname(self._savePath) if self._savePath else self._initialDir
         # Pop up tkFileDialog for save
-        response = filedialog.asksaveasfilename(defaultextension=self._fileTypes[0][1], filetypes=self._fileTypes,
+        response = filedialog.asksaveasfilename(defaultextension=self._defaultExt, filetypes=self._fileTypes,
                                                 initialdir=initial_dir, title='Select file to save as')
         if len(response)>0: # User did not cancel
-            with open(response, mode='w') as f:
-                self._model.writeModelToFile(f, os.path.splitext(response)[1])
+            with open(response, mode='w', buffering=_FILE_BUFFER_SIZE) as f:
+                self._model.writeModelToFile(f, splitext(response)[1])
                 self._savePath = response
         return None
 
@@ -308,6 +423,11 @@ class tkApp(ttk.Frame):
         if self._help_process:
             logger.debug(f"Help Process {self._help_process.name} is alive={self._help_process.is_alive()}")
 
+        # Stop draining async updates, and let the worker threads finish any updates already running
+        if self._drain_after_id is not None:
+            self.after_cancel(self._drain_after_id)
+        self._executor.shutdown(wait=False)
+
         self.master.destroy()
         return None
 
@@ -318,7 +438,7 @@ class tkApp(ttk.Frame):
         """
         if not self._help_process or not self._help_process.is_alive():
             # Help app is not running, so launch it
-            self._help_process = Process(target=_launch_help_app, name='HelpApp Process', kwargs={'help_file':self._appInfo.help_file})
+            self._help_process = Process(target=_launch_help_app, name='HelpApp Process', kwargs={'help_file':self.getAboutInfo().help_file})
             self._help_process.start()
         return None
 
@@ -331,12 +451,13 @@ class tkApp(ttk.Frame):
         Method called when menu item Help | About is selected.
         :return: None
         """
-        msg = self._appInfo.name + '\n'
-        msg += 'version ' + self._appInfo.version + '\n'
-        msg += 'Copyright (c) ' + self._appInfo.copyright + ' by ' + self._appInfo.author + '\n'
-        msg += 'Licensed under the ' + self._appInfo.license + '\n'
-        msg += 'Source: ' + self._appInfo.source
-        dialog_title = 'About ' + self._appInfo.name
+        app_info = self.getAboutInfo()
+        msg = (f"{app_info.name}\n"
+               f"version {app_info.version}\n"
+               f"Copyright (c) {app_info.copyright} by {app_info.author}\n"
+               f"Licensed under the {app_info.license}\n"
+               f"Source: {app_info.source}")
+        dialog_title = f"About {app_info.name}"
         showinfo(title=dialog_title, message=msg, parent=self.master)
         return None
 
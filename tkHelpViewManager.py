@@ -43,7 +43,6 @@ class tkHelpViewManager(tkViewManager):
 
         self._helptxt_widget = HelpTextWidget(self, help_file=self.getModel().help_file)
         self.register_subject(self._helptxt_widget, self.handle_helptxt_widget_update)
-        self._helptxt_widget.attach(self)
         self._helptxt_widget.grid(column=0, row=0, sticky='NWES') # Grid-2
         self.columnconfigure(0, weight=1) # Grid-2
         self.rowconfigure(0, weight=1) # Grid-2
@@ -69,7 +68,7 @@ class tkHelpViewManager(tkViewManager):
 
 # TODO: Assess whether or not this widget needs to keep as a member the path to the help content file,
 # since this can be obtained from the HelpModel through the tkHelpViewManager and tkHelpApp.
-class HelpTextWidget(ttk.Labelframe, Subject):
+class HelpTextWidget(Subject, ttk.Labelframe):
     """
     Class represents a tkinter label frame, the widget contents of which allow viewing of help topic content.
     Class is also a Subject in Observer design pattern.
@@ -79,8 +78,7 @@ class HelpTextWidget(ttk.Labelframe, Subject):
         :parameter parent: tkinter widget that is the parent of this widget
         :parameter help_file: Path to the help file to be opened and displayed initially, string
         """
-        ttk.Labelframe.__init__(self, parent, text="Help Topic Content")
-        Subject.__init__(self)
+        super().__init__(parent, text="Help Topic Content")
         self._help_file=help_file
 
         self._txt_content = tk.Text(self)
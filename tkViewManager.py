@@ -12,8 +12,8 @@ Concrete implementation child classes must:
         Note:
             (a) Handler functions are registered with the tkViewManager via register_subject(...), typically
                 after each widget is created in _CreateWidgets. 
-            (b) Handler functions are automatically called from the update(...) method when a subject (child widget)
-                notifies the tkViewManager by calling notify() on itself.
+            (b) register_subject(...) attaches the tkViewManager to the subject as an observer, and handler functions
+                are then called directly when a subject (child widget) notifies the tkViewManager by calling notify() on itself.
 
 Exported Classes:
     tkViewManager -- Interface (abstract base) class for view managers of tkinter applications.
@@ -29,6 +29,7 @@ Exported Functions:
 # Standard imports
 import tkinter as tk
 from tkinter import ttk
+from abc import abstractmethod
 
 # Local imports
 from ObserverPatternBase import Observer, Subject
@@ -50,8 +51,9 @@ class tkViewManager(ttk.Frame, Observer):
             Note:
                 (a) Handler functions are registered with the tkViewManager via register_subject(...), typically
                     after each widget is created in _CreateWidgets. 
-                (b) Handler functions are automatically called from the update(...) method when a subject (child widget)
-                    notifies the tkViewManager by calling notify() on itself.
+                (b) register_subject(...) attaches the tkViewManager to the subject as an observer, and handler functions
+                    are then called directly when a subject (child widget) notifies the tkViewManager by calling notify()
+                    on itself.
     """
     def __init__(self, parent) -> None:
         """
@@ -64,6 +66,12 @@ class tkViewManager(ttk.Frame, Observer):
         # Maintain a dictionary of Key=subject (child widget), Value=update handler callable
         self._subjects = {}
 
+        # Subjects registered with coalesce=True that have notified since their handlers last ran, in order of first
+        # notification (a dict used as an ordered set), and the id of the scheduled call of _run_coalesced_handlers(),
+        # or None if there is none
+        self._dirty = {}
+        self._idle_after_id = None
+
         # Register the (data and business logic) model as a subject
         self.register_subject(subject=self.getModel(), update_handler=self.handle_model_update)
 
@@ -76,46 +84,132 @@ class tkViewManager(ttk.Frame, Observer):
         Method called after ttk.Frame is destroyed.
         :return: None
         """
-        # Detach this observer from it's subjects, the child widgets of the mediator / view manager
-        self._detach_from_subjects()
+        # Subjects that are descendant widgets of the mediator / view manager are destroyed along with it, so there is
+        # no need to detach from them one by one. Detach from subjects that outlive it, such as the model, and widgets
+        # elsewhere in the app.
+        descendant_prefix = str(self) + '.'
+        for subject in self._subjects:
+            if not (isinstance(subject, tk.Widget) and str(subject).startswith(descendant_prefix)):
+                subject.detach(self)
+        self._subjects.clear()
+        self._dirty.clear()
+        # Cancel a pending run of coalesced handlers, whose Tcl command tkinter deletes when the frame is destroyed
+        if self._idle_after_id is not None:
+            self.after_cancel(self._idle_after_id)
+            self._idle_after_id = None
         return None
         
-    def register_subject(self, subject = None, update_handler = None):
+    def register_subject(self, subject = None, update_handler = None, coalesce = False):
         """
-        Register a subject (child widget or model) and the callable to handle subject updates.
+        Register a subject (child widget or model) and the callable to handle subject updates, and attach the
+        tkViewManager to the subject as an observer. When the subject notifies, update_handler is called directly,
+        without going through update(...).
         :parameter subject: The child widget or model subject, an object of type Subject and type (tk.Widget of Model)
-        :parameter update_handler: The callable function to handle updates for the subject
+        :parameter update_handler: The callable function to handle updates for the subject, taking no arguments.
+                                   Preferably a method of the tkViewManager. Any other callable is held strongly by
+                                   the subject, so if it refers to the tkViewManager (e.g., lambda: self.handle_x(1)),
+                                   the subject keeps the tkViewManager alive until it is detached.
+        :parameter coalesce: If True, update_handler is instead called once, when the tkinter event loop is next idle,
+                             however many times the subject notifies before then. Suits subjects that notify in
+                             rapid bursts (e.g., while a slider is dragged), and handlers that only need the latest state.
         :return: None
         """
         assert(isinstance(subject, Subject))
         assert(isinstance(subject, tk.Widget) or isinstance(subject, Model))
         assert(callable(update_handler))
         self._subjects[subject]=update_handler
+        self._attach_to_subject(subject, update_handler, coalesce)
+        return None
+
+    def register_subjects(self, subject_handlers, coalesce = False):
+        """
+        Register many subjects and their update handlers at once, as if by calling register_subject(...) for each.
+        The arguments are checked once, up front, rather than per subject.
+        :parameter subject_handlers: Dictionary of Key=subject, Value=update handler callable, or an iterable of
+                                     (subject, update handler) pairs
+        :parameter coalesce: As for register_subject(...), applied to all of the subjects
+        :return: None
+        """
+        subject_handlers = dict(subject_handlers)
+        assert(all((isinstance(subject, Subject) and (isinstance(subject, tk.Widget) or isinstance(subject, Model))
+                    and callable(update_handler)) for subject, update_handler in subject_handlers.items()))
+        self._subjects.update(subject_handlers)
+        for subject, update_handler in subject_handlers.items():
+            self._attach_to_subject(subject, update_handler, coalesce)
+        return None
+
+    def _attach_to_subject(self, subject, update_handler, coalesce):
+        """
+        Utility function called by register_subject(...) and register_subjects(...) to attach the tkViewManager to
+        subject as an observer, with a handler that calls update_handler.
+        :parameter subject: The child widget or model subject
+        :parameter update_handler: The callable function to handle updates for the subject, taking no arguments
+        :parameter coalesce: If True, calls of update_handler are coalesced, see register_subject(...)
+        :return: None
+        """
+        if coalesce:
+            subject.attach(self, self._mark_dirty)
+        elif getattr(update_handler, '__self__', None) is self:
+            # Call the handler's underlying function, so that the subject does not keep the tkViewManager alive
+            handler_func = update_handler.__func__
+            subject.attach_function(self, lambda observer, notifier: handler_func(observer))
+        else:
+            # The subject holds update_handler strongly, see register_subject(...)
+            subject.attach(self, lambda notifier: update_handler())
         return None
     
+    def _mark_dirty(self, subject):
+        """
+        Handler attached by register_subject(...) for a subject registered with coalesce=True. Records that subject has
+        notified, and schedules _run_coalesced_handlers() for when the tkinter event loop is next idle.
+        :parameter subject: The notifying subject
+        :return None:
+        """
+        self._dirty[subject] = None
+        if self._idle_after_id is None:
+            self._idle_after_id = self.after_idle(self._run_coalesced_handlers)
+        return None
+
+    def _run_coalesced_handlers(self):
+        """
+        Utility function called from the tkinter event loop, which calls the update handler of each subject recorded
+        by _mark_dirty(...) once.
+        :return None:
+        """
+        self._idle_after_id = None
+        # Swap in a new dict first, so that handlers causing further notifications schedule another run
+        dirty = self._dirty
+        self._dirty = {}
+        for subject in dirty:
+            update_handler = self._subjects.get(subject)
+            if update_handler:
+                update_handler()
+        return None
+
     def _detach_from_subjects(self):
         """
-        Detach tkViewManager from all subjects (child widgets). Called from onDestroy(...).
+        Detach tkViewManager from all subjects (child widgets and model).
         :return None:
         """
         for subject in self._subjects:
             subject.detach(self)
         return None
 
+    @abstractmethod
     def _CreateWidgets(self):
         """
         Abstract utility function to be called by __init__ to set up the child widgets of the tkViewManager widget.
         register_subject(...) should be called for each child widget that is a Subject, to register the widget
         and a handler function for updates from that widget.
-        Must be implemented by children. Will raise NotImplementedError if called.
+        Must be implemented by children, otherwise they cannot be instantiated.
         :return None:
         """
-        raise NotImplementedError
-        return None
 
     def update(self, subject):
         """
         Implementation of Observer.update(). Acts as a switchboard based on which widget is notifying.
+        Subjects registered with register_subject(...) call their handler directly, so this is only called by
+        a registered subject that the tkViewManager was (re)attached to without a handler.
         :parameter subject: Which widget instance is notifying the mediator?
         :return None:
         """